@@ -13,6 +13,7 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 from .core.analyzer import CodebaseAnalyzer
+from .core.parser import PARSER_BACKENDS
 from .export.formats import GraphExporter, export_analysis_results
 from .graph.builder import GraphBuilder, GraphType
 from .graph.interactive import InteractiveGraphExplorer
@@ -41,7 +42,11 @@ def cmd_scan(args: argparse.Namespace) -> None:
         sys.exit(1)
 
     # Setup analyzer
-    analyzer = CodebaseAnalyzer(exclude_patterns=args.exclude, max_workers=args.workers)
+    analyzer = CodebaseAnalyzer(
+        exclude_patterns=args.exclude,
+        max_workers=args.workers,
+        parser_backend=args.parser,
+    )
 
     # Perform analysis with progress indicator
     with Progress(
@@ -119,7 +124,11 @@ def cmd_graph(args: argparse.Namespace) -> None:
         sys.exit(1)
 
     # Setup analyzer
-    analyzer = CodebaseAnalyzer(exclude_patterns=args.exclude, max_workers=args.workers)
+    analyzer = CodebaseAnalyzer(
+        exclude_patterns=args.exclude,
+        max_workers=args.workers,
+        parser_backend=args.parser,
+    )
 
     # Perform analysis
     with Progress(
@@ -213,7 +222,9 @@ def cmd_search(args: argparse.Namespace) -> None:
         sys.exit(1)
 
     # Setup analyzer
-    analyzer = CodebaseAnalyzer(exclude_patterns=args.exclude)
+    analyzer = CodebaseAnalyzer(
+        exclude_patterns=args.exclude, parser_backend=args.parser
+    )
 
     # Perform analysis
     with Progress(
@@ -317,7 +328,9 @@ def cmd_export(args: argparse.Namespace) -> None:
     graph_types = args.types if args.types else ["imports", "inheritance", "calls"]
 
     # Setup analyzer
-    analyzer = CodebaseAnalyzer(exclude_patterns=args.exclude)
+    analyzer = CodebaseAnalyzer(
+        exclude_patterns=args.exclude, parser_backend=args.parser
+    )
 
     # Perform analysis
     with Progress(
@@ -359,32 +372,8 @@ def cmd_export(args: argparse.Namespace) -> None:
         console.print(f"Files saved to: [cyan]{output_dir}[/cyan]")
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create the argument parser."""
-    parser = argparse.ArgumentParser(
-        prog="idgi",
-        description="Explore and visualize large Python codebases",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  idgi scan ./my_project
-  idgi graph --type imports --interactive ./my_project
-  idgi search "DataLoader" ./my_project
-  idgi export --format svg png --output ./graphs ./my_project
-        """,
-    )
-
-    parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
-    parser.add_argument(
-        "--workers", type=int, default=4, help="Number of worker processes"
-    )
-
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-
-    # Scan subcommand
-    scan_parser = subparsers.add_parser(
-        "scan", help="Scan directory and analyze Python files"
-    )
+def _configure_scan_parser(scan_parser: argparse.ArgumentParser) -> None:
+    """Add arguments for the scan subcommand."""
     scan_parser.add_argument("directory", help="Directory to scan")
     scan_parser.add_argument("--exclude", action="append", help="Patterns to exclude")
     scan_parser.add_argument(
@@ -400,8 +389,9 @@ Examples:
         "--show-errors", action="store_true", help="Show parsing errors"
     )
 
-    # Graph subcommand
-    graph_parser = subparsers.add_parser("graph", help="Generate and display graphs")
+
+def _configure_graph_parser(graph_parser: argparse.ArgumentParser) -> None:
+    """Add arguments for the graph subcommand."""
     graph_parser.add_argument("directory", help="Directory to analyze")
     graph_parser.add_argument(
         "--type",
@@ -430,10 +420,9 @@ Examples:
     )
     graph_parser.add_argument("--exclude", action="append", help="Patterns to exclude")
 
-    # Search subcommand
-    search_parser = subparsers.add_parser(
-        "search", help="Search for classes, functions, modules"
-    )
+
+def _configure_search_parser(search_parser: argparse.ArgumentParser) -> None:
+    """Add arguments for the search subcommand."""
     search_parser.add_argument("term", help="Search term")
     search_parser.add_argument("directory", help="Directory to search")
     search_parser.add_argument(
@@ -441,8 +430,9 @@ Examples:
     )
     search_parser.add_argument("--exclude", action="append", help="Patterns to exclude")
 
-    # Export subcommand
-    export_parser = subparsers.add_parser("export", help="Export graphs to files")
+
+def _configure_export_parser(export_parser: argparse.ArgumentParser) -> None:
+    """Add arguments for the export subcommand."""
     export_parser.add_argument("directory", help="Directory to analyze")
     export_parser.add_argument("--output", required=True, help="Output directory")
     export_parser.add_argument(
@@ -459,6 +449,48 @@ Examples:
     )
     export_parser.add_argument("--exclude", action="append", help="Patterns to exclude")
 
+
+def create_parser() -> argparse.ArgumentParser:
+    """Create the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="idgi",
+        description="Explore and visualize large Python codebases",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  idgi scan ./my_project
+  idgi graph --type imports --interactive ./my_project
+  idgi search "DataLoader" ./my_project
+  idgi export --format svg png --output ./graphs ./my_project
+        """,
+    )
+
+    parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    parser.add_argument(
+        "--workers", type=int, default=4, help="Number of worker processes"
+    )
+    parser.add_argument(
+        "--parser",
+        choices=PARSER_BACKENDS,
+        default="ast",
+        help="Parser backend (tree_sitter requires the tree-sitter extra)",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    _configure_scan_parser(
+        subparsers.add_parser("scan", help="Scan directory and analyze Python files")
+    )
+    _configure_graph_parser(
+        subparsers.add_parser("graph", help="Generate and display graphs")
+    )
+    _configure_search_parser(
+        subparsers.add_parser("search", help="Search for classes, functions, modules")
+    )
+    _configure_export_parser(
+        subparsers.add_parser("export", help="Export graphs to files")
+    )
+
     return parser
 
 
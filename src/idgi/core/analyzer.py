@@ -3,10 +3,9 @@ High-level code analysis that combines scanning and parsing to build comprehensi
 """
 
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 from .parser import BatchParser, ModuleInfo
 from .scanner import DirectoryScanner, ScanResult
@@ -47,6 +46,8 @@ class CodebaseAnalyzer:
         exclude_patterns: Optional[List[str]] = None,
         include_patterns: Optional[List[str]] = None,
         max_workers: int = 4,
+        parse_cache_dir: Optional[Path] = None,
+        parser_backend: str = "ast",
     ):
         """
         Initialize the codebase analyzer.
@@ -55,13 +56,20 @@ class CodebaseAnalyzer:
             exclude_patterns: Patterns to exclude during scanning
             include_patterns: Patterns to include during scanning
             max_workers: Maximum number of parallel workers
+            parse_cache_dir: Directory for the persistent parse cache, which
+                lets unchanged files skip parsing on later runs
+            parser_backend: Parser backend, "ast" or "tree_sitter"
         """
         self.scanner = DirectoryScanner(
             exclude_patterns=exclude_patterns,
             include_patterns=include_patterns,
             max_workers=max_workers,
         )
-        self.batch_parser = BatchParser()
+        self.batch_parser = BatchParser(
+            max_workers=max_workers,
+            cache_dir=parse_cache_dir,
+            backend=parser_backend,
+        )
         self.max_workers = max_workers
         self.logger = logging.getLogger(__name__)
 
@@ -87,8 +95,7 @@ class CodebaseAnalyzer:
         self.logger.info(f"Parsed {len(modules)} modules")
 
         # Step 3: Build dependency graphs
-        import_graph = self.batch_parser.get_import_graph(modules)
-        inheritance_graph = self.batch_parser.get_inheritance_graph(modules)
+        import_graph, inheritance_graph = self.batch_parser.get_graphs(modules)
         call_graph = self._build_call_graph(modules)
 
         # Step 4: Calculate statistics
@@ -121,36 +128,8 @@ class CodebaseAnalyzer:
 
     def _parse_modules_parallel(self, file_paths: List[Path]) -> Dict[Path, ModuleInfo]:
         """Parse modules in parallel for better performance."""
-        modules = {}
-
-        # For small numbers of files, don't use parallelization
-        if len(file_paths) < 20:
-            return self.batch_parser.parse_files(file_paths)
-
-        # Split files into chunks for parallel processing
-        chunk_size = max(1, len(file_paths) // self.max_workers)
-        file_chunks = [
-            file_paths[i : i + chunk_size]
-            for i in range(0, len(file_paths), chunk_size)
-        ]
-
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_chunk = {
-                executor.submit(self.batch_parser.parse_files, chunk): chunk
-                for chunk in file_chunks
-            }
-
-            for future in as_completed(future_to_chunk):
-                try:
-                    chunk_results = future.result()
-                    modules.update(chunk_results)
-                except Exception as e:
-                    chunk = future_to_chunk[future]
-                    self.logger.error(
-                        f"Error parsing chunk with {len(chunk)} files: {e}"
-                    )
-
-        return modules
+        # BatchParser decides between in-process parsing and a process pool
+        return self.batch_parser.parse_files(file_paths)
 
     def _build_call_graph(self, modules: Dict[Path, ModuleInfo]) -> Dict[str, Set[str]]:
         """
@@ -207,15 +186,12 @@ class CodebaseAnalyzer:
                 total_classes += 1
                 total_functions += len(class_info.methods)
 
-                # Count nested classes
-                def count_nested(cls: Any) -> int:
-                    count = len(cls.nested_classes)
-                    for nested in cls.nested_classes:
-                        count += count_nested(nested)
-                        count += len(nested.methods)
-                    return count
-
-                total_classes += count_nested(class_info)
+                # Count nested classes, iteratively to avoid per-level calls
+                nested_classes = list(class_info.nested_classes)
+                while nested_classes:
+                    nested = nested_classes.pop()
+                    total_classes += 1 + len(nested.methods)
+                    nested_classes.extend(nested.nested_classes)
 
         return total_classes, total_functions, total_imports
 
@@ -0,0 +1,66 @@
+"""
+Batched file reading for the parsing pipeline.
+"""
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Deque, Iterable, Iterator, Tuple, Union
+
+# File contents, or the error raised while reading them
+ReadResult = Union[bytes, Exception]
+
+# Reads kept in flight per reader thread
+READ_AHEAD_PER_WORKER = 64
+
+
+def _read_file(file_path: Path) -> ReadResult:
+    """Read a file, returning the error instead of raising it."""
+    try:
+        with open(file_path, "rb") as f:
+            return f.read()
+    except Exception as e:
+        return e
+
+
+class BatchReader:
+    """Reads files on a thread pool, ahead of whoever consumes them."""
+
+    def __init__(self, max_workers: int = 4):
+        """
+        Initialize the reader.
+
+        Args:
+            max_workers: Number of reader threads
+        """
+        self.max_workers = max(1, max_workers)
+
+    def iter_read(
+        self, file_paths: Iterable[Path]
+    ) -> Iterator[Tuple[Path, ReadResult]]:
+        """
+        Read files concurrently, yielding them in input order.
+
+        Blocking reads release the GIL, so the disk stays busy while the
+        caller works on files that have already arrived. At most
+        READ_AHEAD_PER_WORKER reads per thread are queued at any time.
+
+        Args:
+            file_paths: Files to read
+
+        Yields:
+            Tuples of (file path, contents or read error)
+        """
+        read_ahead = READ_AHEAD_PER_WORKER * self.max_workers
+        pending: Deque[Tuple[Path, "Future[ReadResult]"]] = deque()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for file_path in file_paths:
+                pending.append((file_path, executor.submit(_read_file, file_path)))
+                if len(pending) >= read_ahead:
+                    path, future = pending.popleft()
+                    yield path, future.result()
+
+            while pending:
+                path, future = pending.popleft()
+                yield path, future.result()
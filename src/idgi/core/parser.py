@@ -3,12 +3,43 @@ Python AST parsing for extracting classes, functions, imports, and other code el
 """
 
 import ast
-from dataclasses import dataclass, field
+import hashlib
+import os
+import pickle
+import re
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import suppress
+from dataclasses import dataclass, field, replace
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Union
-
-
-@dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
+
+from .. import __version__
+from .io import BatchReader
+
+if TYPE_CHECKING:
+    from .tree_sitter_parser import TreeSitterParser
+
+# Parses create many of these records, so drop the per-instance __dict__
+# where dataclasses support it (Python 3.10+)
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class ImportInfo:
     """Information about an import statement."""
 
@@ -21,7 +52,7 @@ class ImportInfo:
     line_number: int = 0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FunctionInfo:
     """Information about a function definition."""
 
@@ -39,7 +70,7 @@ class FunctionInfo:
     )  # Functions called within this function
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ClassInfo:
     """Information about a class definition."""
 
@@ -53,7 +84,7 @@ class ClassInfo:
     nested_classes: List["ClassInfo"] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ModuleInfo:
     """Complete information about a Python module."""
 
@@ -67,98 +98,324 @@ class ModuleInfo:
     syntax_errors: List[str] = field(default_factory=list)
 
 
+def _build_statement_fields() -> Dict[type, Tuple[str, ...]]:
+    """
+    Map node types to the fields that can hold statements.
+
+    Everything the parser extracts is a statement, and statements only appear
+    in these list fields, never inside expressions. Fields are reversed so
+    the visitor can push them onto its stack and still walk in source order.
+    """
+    statement_fields = {}
+
+    for node_type in vars(ast).values():
+        if not isinstance(node_type, type) or not issubclass(node_type, ast.AST):
+            continue
+        if issubclass(node_type, ast.expr) or node_type is ast.Expression:
+            # Expression bodies (lambda, ternary, eval input) are single nodes
+            continue
+
+        fields = tuple(
+            name
+            for name in reversed(node_type._fields)
+            if name in ("body", "orelse", "handlers", "finalbody", "cases")
+        )
+        if fields:
+            statement_fields[node_type] = fields
+
+    return statement_fields
+
+
+_STATEMENT_FIELDS = _build_statement_fields()
+
+# Fields that can hold child nodes, as ast.iter_child_nodes would visit them.
+# Expression contexts (Load, Store, Del) never hold calls and are skipped.
+_CHILD_FIELDS: Dict[type, Tuple[str, ...]] = {
+    node_type: tuple(name for name in node_type._fields if name != "ctx")
+    for node_type in vars(ast).values()
+    if isinstance(node_type, type) and issubclass(node_type, ast.AST)
+}
+
+# A line holding anything besides whitespace or a comment; Python also ends
+# lines at a lone carriage return
+_CODE_LINE = re.compile(rb"(?:^|\r)[ \t\f]*[^# \t\f\r\n]", re.MULTILINE)
+
+
+# Function definitions, which the parser treats alike
+_FUNCDEF_TYPES = frozenset((ast.FunctionDef, ast.AsyncFunctionDef))
+
+# Available parser backends; tree_sitter needs optional packages
+PARSER_BACKENDS = ("ast", "tree_sitter")
+
+
 class PythonASTParser:
     """
     Parses Python source files using AST to extract structural information.
+
+    The parser holds configuration only; per-file state lives in an
+    extractor created for each file, so one instance can be reused for any
+    number of files.
     """
 
-    def __init__(self) -> None:
-        self.current_class_stack: List[str] = []
+    def __init__(self, cache_dir: Optional[Path] = None, backend: str = "ast") -> None:
+        """
+        Initialize the parser.
 
-    def parse_file(self, file_path: Path) -> ModuleInfo:
+        Args:
+            cache_dir: Directory for the persistent parse cache, keyed by
+                source content (disabled when None)
+            backend: Parser backend, "ast" or "tree_sitter". The ast backend
+                reports syntax errors exactly as Python does.
+
+        Raises:
+            ValueError: If the backend is unknown
+            ImportError: If the tree_sitter backend's packages are missing
+        """
+        if backend not in PARSER_BACKENDS:
+            raise ValueError(f"Unknown parser backend: {backend}")
+
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.backend = backend
+
+        self._tree_sitter: Optional["TreeSitterParser"] = None
+        if backend == "tree_sitter":
+            # Imported here since the backend builds on this module
+            from .tree_sitter_parser import TreeSitterParser
+
+            self._tree_sitter = TreeSitterParser()
+
+    def parse_file(
+        self, file_path: Path, source_bytes: Optional[bytes] = None
+    ) -> ModuleInfo:
         """
         Parse a Python file and extract structural information.
 
         Args:
             file_path: Path to the Python file to parse
+            source_bytes: Contents of the file if already read, otherwise
+                the file is read from disk
 
         Returns:
             ModuleInfo containing extracted information
         """
-        module_info = ModuleInfo(file_path=file_path)
+        if source_bytes is None:
+            try:
+                with open(file_path, "rb") as f:
+                    source_bytes = f.read()
+            except Exception as e:
+                return ModuleInfo(
+                    file_path=file_path,
+                    syntax_errors=[f"Error reading file: {str(e)}"],
+                )
+
+        if self.cache_dir is None:
+            return self._parse_source(file_path, source_bytes)
 
+        cache_path = self._get_cache_path(self.cache_dir, source_bytes)
+        cached = self._load_cached(cache_path)
+        if cached is not None:
+            # Identical sources may live at several paths
+            return replace(cached, file_path=file_path)
+
+        module_info = self._parse_source(file_path, source_bytes)
+        if not module_info.syntax_errors:
+            # Error messages name the file, so only clean results are shared
+            self._store_cached(cache_path, module_info)
+        return module_info
+
+    def _get_cache_path(self, cache_dir: Path, source_bytes: bytes) -> Path:
+        """Get the cache file for a source, keyed by content and versions."""
+        digest = hashlib.sha256(source_bytes)
+        # Extraction output depends on the Python grammar, idgi and backend
+        versions = f"{sys.implementation.cache_tag}-{__version__}-{self.backend}"
+        digest.update(versions.encode())
+        key = digest.hexdigest()
+        return cache_dir / key[:2] / f"{key}.pkl"
+
+    @staticmethod
+    def _load_cached(cache_path: Path) -> Optional[ModuleInfo]:
+        """Load a cached ModuleInfo, treating unreadable entries as misses."""
         try:
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                source_code = f.read()
-                module_info.line_count = source_code.count("\n") + 1
+            with open(cache_path, "rb") as f:
+                cached = pickle.load(f)
+        except Exception:
+            return None
+        return cached if isinstance(cached, ModuleInfo) else None
 
+    @staticmethod
+    def _store_cached(cache_path: Path, module_info: ModuleInfo) -> None:
+        """Store a ModuleInfo in the cache; failures only cost a re-parse."""
+        temp_path: Optional[Path] = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so concurrent workers never see partial files
+            with tempfile.NamedTemporaryFile(
+                dir=cache_path.parent, suffix=".tmp", delete=False
+            ) as f:
+                temp_path = Path(f.name)
+                pickle.dump(module_info, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_path)
+        except Exception:
+            if temp_path is not None:
+                with suppress(OSError):
+                    temp_path.unlink()
+
+    def _parse_source(self, file_path: Path, source_bytes: bytes) -> ModuleInfo:
+        """Extract structural information from a file's source."""
+        module_info = ModuleInfo(file_path=file_path)
+
+        # Count lines as text mode would, where a lone carriage return also
+        # ends a line. Undecodable bytes are never line breaks.
+        line_count = source_bytes.count(b"\n") + 1
+        if b"\r" in source_bytes:
+            line_count += source_bytes.count(b"\r") - source_bytes.count(b"\r\n")
+        module_info.line_count = line_count
+
+        # Files of only comments and blank lines, such as many __init__.py
+        # files, define nothing. Coding declarations still go to the parser,
+        # which rejects unknown encodings.
+        if not _CODE_LINE.search(source_bytes) and b"coding" not in source_bytes:
+            return module_info
+
+        if self._tree_sitter is not None:
+            self._tree_sitter.extract(source_bytes, module_info)
+            return module_info
+
+        tree: Optional[ast.Module]
+        try:
+            # Bytes are decoded by the tokenizer, honouring BOMs and coding
+            # cookies, without first building a str copy of the source
+            tree = ast.parse(source_bytes, filename=str(file_path))
+        except SyntaxError:
+            # Also raised for invalid UTF-8, which the text parse tolerates
+            tree = self._parse_lenient(file_path, source_bytes, module_info)
         except Exception as e:
-            module_info.syntax_errors.append(f"Error reading file: {str(e)}")
+            module_info.syntax_errors.append(f"Parse error: {str(e)}")
+            return module_info
+
+        if tree is None:
             return module_info
 
+        _ASTExtractor().extract(tree, module_info)
+        return module_info
+
+    def _parse_lenient(
+        self, file_path: Path, source_bytes: bytes, module_info: ModuleInfo
+    ) -> Optional[ast.Module]:
+        """
+        Parse a source that failed to parse as bytes, ignoring bad UTF-8.
+
+        Args:
+            file_path: Path of the file, for error messages
+            source_bytes: Contents of the file
+            module_info: ModuleInfo to record errors on
+
+        Returns:
+            The parsed module, or None if it has errors
+        """
+        source_code = source_bytes.decode("utf-8", errors="ignore")
         try:
-            tree = ast.parse(source_code, filename=str(file_path))
+            return ast.parse(source_code, filename=str(file_path))
         except SyntaxError as e:
             module_info.syntax_errors.append(f"Syntax error: {str(e)}")
-            return module_info
         except Exception as e:
             module_info.syntax_errors.append(f"Parse error: {str(e)}")
-            return module_info
+        return None
+
+
+class _StructureExtractor:
+    """
+    Placement rules for functions and classes, shared by the parser backends.
+
+    Subclasses walk their own syntax trees and build FunctionInfo and
+    ClassInfo objects; this class decides where those objects are recorded.
+    """
+
+    def __init__(self) -> None:
+        self.current_class_stack: List[str] = []
+
+    def _visit_function(self, node: Any, module_info: ModuleInfo) -> None:
+        """Record a function, or mark it as a method inside a class."""
+        func_info = self._process_function(node, module_info)
+        if self.current_class_stack:
+            # This is a method
+            func_info.is_method = True
+            func_info.parent_class = self.current_class_stack[-1]
+        else:
+            # This is a top-level function
+            module_info.functions.append(func_info)
+
+    def _visit_class(self, node: Any, module_info: ModuleInfo) -> None:
+        """Record a class, attaching nested classes to their parent."""
+        class_info = self._process_class(node, module_info)
+        if self.current_class_stack:
+            # This is a nested class
+            # Find the parent class and add to its nested_classes
+            parent_class = next(
+                (
+                    c
+                    for c in module_info.classes
+                    if c.name == self.current_class_stack[-1]
+                ),
+                None,
+            )
+            if parent_class:
+                parent_class.nested_classes.append(class_info)
+        else:
+            # This is a top-level class
+            module_info.classes.append(class_info)
+
+    def _process_function(self, node: Any, module_info: ModuleInfo) -> FunctionInfo:
+        """Build the FunctionInfo for a function definition."""
+        raise NotImplementedError
+
+    def _process_class(self, node: Any, module_info: ModuleInfo) -> ClassInfo:
+        """Build the ClassInfo for a class definition, visiting its body."""
+        raise NotImplementedError
 
+
+class _ASTExtractor(_StructureExtractor):
+    """Extracts module structure from one file's AST."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Calls of nested functions, gathered while walking the outer one
+        self._nested_calls: Dict[int, List[str]] = {}
+
+    def extract(self, tree: ast.Module, module_info: ModuleInfo) -> None:
+        """
+        Add the structure of a parsed module to module_info.
+
+        Args:
+            tree: Parsed module
+            module_info: ModuleInfo to fill in
+        """
         # Extract module docstring
         module_info.docstring = ast.get_docstring(tree)
 
         # Visit all nodes in the AST
         self._visit_node(tree, module_info)
 
-        return module_info
-
     def _visit_node(self, node: ast.AST, module_info: ModuleInfo) -> None:
         """Visit an AST node and extract relevant information."""
+        # Walk with an explicit stack rather than recursing per node
+        dispatch = _DISPATCH
+        stack = [node]
 
-        if isinstance(node, ast.Import):
-            self._process_import(node, module_info)
+        while stack:
+            node = stack.pop()
+            node_type = type(node)
 
-        elif isinstance(node, ast.ImportFrom):
-            self._process_import_from(node, module_info)
+            handler = dispatch.get(node_type)
+            if handler is not None:
+                handler(self, node, module_info)
+                if node_type is ast.ClassDef:
+                    # _process_class visits the class body itself
+                    continue
 
-        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            func_info = self._process_function(node, module_info)
-            if self.current_class_stack:
-                # This is a method
-                func_info.is_method = True
-                func_info.parent_class = self.current_class_stack[-1]
-            else:
-                # This is a top-level function
-                module_info.functions.append(func_info)
-
-        elif isinstance(node, ast.ClassDef):
-            class_info = self._process_class(node, module_info)
-            if self.current_class_stack:
-                # This is a nested class
-                # Find the parent class and add to its nested_classes
-                parent_class = next(
-                    (
-                        c
-                        for c in module_info.classes
-                        if c.name == self.current_class_stack[-1]
-                    ),
-                    None,
-                )
-                if parent_class:
-                    parent_class.nested_classes.append(class_info)
-            else:
-                # This is a top-level class
-                module_info.classes.append(class_info)
-            # Don't recursively visit child nodes for classes - _process_class handles this
-            return
-
-        elif isinstance(node, ast.Assign):
-            self._process_assignment(node, module_info)
-
-        # Recursively visit child nodes
-        for child in ast.iter_child_nodes(node):
-            self._visit_node(child, module_info)
+            # Push children in reverse so they are visited in source order
+            for field_name in _STATEMENT_FIELDS.get(node_type, ()):
+                stack.extend(reversed(getattr(node, field_name)))
 
     def _process_import(self, node: ast.Import, module_info: ModuleInfo) -> None:
         """Process an import statement."""
@@ -211,7 +468,7 @@ class PythonASTParser:
             name=node.name,
             line_start=node.lineno,
             line_end=getattr(node, "end_lineno", node.lineno),
-            is_async=isinstance(node, ast.AsyncFunctionDef),
+            is_async=type(node) is ast.AsyncFunctionDef,
         )
 
         # Extract function arguments
@@ -257,14 +514,20 @@ class PythonASTParser:
         self.current_class_stack.append(node.name)
 
         for child in node.body:
-            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                method_info = self._process_function(child, module_info)
+            child_type = type(child)
+            if child_type in _FUNCDEF_TYPES:
+                method_info = self._process_function(
+                    cast(Union[ast.FunctionDef, ast.AsyncFunctionDef], child),
+                    module_info,
+                )
                 method_info.is_method = True
                 method_info.parent_class = node.name
                 class_info.methods.append(method_info)
 
-            elif isinstance(child, ast.ClassDef):
-                nested_class = self._process_class(child, module_info)
+            elif child_type is ast.ClassDef:
+                nested_class = self._process_class(
+                    cast(ast.ClassDef, child), module_info
+                )
                 class_info.nested_classes.append(nested_class)
             else:
                 # Process other child nodes (but not ClassDef as we handle them above)
@@ -278,81 +541,234 @@ class PythonASTParser:
         """Process variable assignments at module level."""
         if not self.current_class_stack:  # Only global variables
             for target in node.targets:
-                if isinstance(target, ast.Name):
+                if type(target) is ast.Name:
                     module_info.global_variables.append(target.id)
 
     def _get_decorator_name(self, decorator: ast.AST) -> str:
         """Extract decorator name from AST node."""
-        if isinstance(decorator, ast.Name):
-            return decorator.id
-        elif isinstance(decorator, ast.Attribute):
+        decorator_type = type(decorator)
+        if decorator_type is ast.Name:
+            return cast(ast.Name, decorator).id
+        elif decorator_type is ast.Attribute:
             name = self._get_name_from_node(decorator)
             return name if name is not None else str(decorator)
-        elif isinstance(decorator, ast.Call):
-            name = self._get_name_from_node(decorator.func)
+        elif decorator_type is ast.Call:
+            name = self._get_name_from_node(cast(ast.Call, decorator).func)
             return name if name is not None else str(decorator)
         else:
             return str(decorator)
 
     def _get_name_from_node(self, node: ast.AST) -> Optional[str]:
         """Extract name from various AST node types."""
-        if isinstance(node, ast.Name):
+        if type(node) is ast.Name:
             return node.id
-        elif isinstance(node, ast.Attribute):
-            value = self._get_name_from_node(node.value)
-            if value:
-                return f"{value}.{node.attr}"
-            return node.attr
-        elif isinstance(node, ast.Constant) and isinstance(node.value, str):
-            return node.value
-        else:
-            return None
+
+        # Collect a dotted chain such as a.b.c right to left in one pass
+        attrs = []
+        while type(node) is ast.Attribute:
+            attrs.append(node.attr)
+            node = node.value
+
+        base: Optional[str] = None
+        if type(node) is ast.Name:
+            base = node.id
+        elif type(node) is ast.Constant and type(node.value) is str:
+            base = node.value
+
+        if not attrs:
+            return base
+        if base:
+            attrs.append(base)
+        attrs.reverse()
+        # Identifiers from ast are interned; share joined names likewise
+        return sys.intern(".".join(attrs))
 
     def _find_function_calls(self, func_node: ast.AST) -> List[str]:
-        """Find all function calls within a function."""
-        calls = []
+        """
+        Find all function calls within a function.
 
-        for node in ast.walk(func_node):
-            if isinstance(node, ast.Call):
-                call_name = self._get_name_from_node(node.func)
+        Calls are listed in ast.walk order and include those in nested
+        functions. A single breadth-first walk of the outermost function
+        also gathers the calls of every function nested in it, in the order
+        their own walks would find them, so nested functions are not walked
+        again when they are processed.
+        """
+        calls = self._nested_calls.pop(id(func_node), None)
+        if calls is not None:
+            return calls
+
+        calls = []
+        child_fields = _CHILD_FIELDS
+        nested_calls = self._nested_calls
+        AST = ast.AST
+        Call = ast.Call
+
+        # Each node is queued with the call lists of the functions around it
+        queue: List[Tuple[ast.AST, Tuple[List[str], ...]]] = [(func_node, (calls,))]
+        index = 0
+        while index < len(queue):
+            node, owners = queue[index]
+            index += 1
+            node_type = type(node)
+
+            if node_type is Call:
+                call_name = self._get_name_from_node(cast(ast.Call, node).func)
                 if call_name:
-                    calls.append(call_name)
+                    for owner in owners:
+                        owner.append(call_name)
+            elif node_type in _FUNCDEF_TYPES and node is not func_node:
+                own_calls: List[str] = []
+                nested_calls[id(node)] = own_calls
+                owners = (*owners, own_calls)
+
+            for field_name in child_fields.get(node_type, node._fields):
+                value = getattr(node, field_name, None)
+                if isinstance(value, AST):
+                    queue.append((value, owners))
+                elif type(value) is list:
+                    for item in value:
+                        if isinstance(item, AST):
+                            queue.append((item, owners))
 
         return calls
 
 
+# Statement handlers keyed by exact node type, so each visited node costs
+# one dict lookup instead of a chain of isinstance checks
+_DISPATCH: Dict[type, Callable[[_ASTExtractor, Any, ModuleInfo], None]] = {
+    ast.Import: _ASTExtractor._process_import,
+    ast.ImportFrom: _ASTExtractor._process_import_from,
+    ast.FunctionDef: _ASTExtractor._visit_function,
+    ast.AsyncFunctionDef: _ASTExtractor._visit_function,
+    ast.ClassDef: _ASTExtractor._visit_class,
+    ast.Assign: _ASTExtractor._process_assignment,
+}
+
+
+# Below this many files, process pool startup costs more than it saves
+PARALLEL_PARSE_THRESHOLD = 8
+
+
+def _available_cpus() -> int:
+    """Return the number of CPUs this process is allowed to run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        # sched_getaffinity is not available on macOS and Windows
+        return os.cpu_count() or 1
+
+
+def _parse_file_safely(
+    parser: PythonASTParser, file_path: Path, source_bytes: Optional[bytes] = None
+) -> ModuleInfo:
+    """Parse a file, turning unexpected failures into a ModuleInfo error."""
+    try:
+        return parser.parse_file(file_path, source_bytes)
+    except Exception as e:
+        # Create a ModuleInfo with error information
+        return ModuleInfo(
+            file_path=file_path, syntax_errors=[f"Failed to parse: {str(e)}"]
+        )
+
+
+def _parse_files_read_ahead(
+    parser: PythonASTParser, file_paths: List[Path]
+) -> List[ModuleInfo]:
+    """Parse files in order while threads read the following ones."""
+    # Failed reads are retried by parse_file, which reports the error
+    return [
+        _parse_file_safely(
+            parser, file_path, source if isinstance(source, bytes) else None
+        )
+        for file_path, source in BatchReader().iter_read(file_paths)
+    ]
+
+
+# The parser of a process pool worker, shared by every chunk it parses
+_worker_parser: Optional[PythonASTParser] = None
+
+
+def _init_worker(cache_dir: Optional[Path], backend: str) -> None:
+    """Process pool initializer; builds the worker's parser once."""
+    global _worker_parser
+    _worker_parser = PythonASTParser(cache_dir, backend)
+
+
+def _parse_chunk_in_worker(file_paths: List[Path]) -> List[ModuleInfo]:
+    """Process pool entry point; module-level so it can be pickled."""
+    return _parse_files_read_ahead(cast(PythonASTParser, _worker_parser), file_paths)
+
+
 class BatchParser:
     """
     Parse multiple Python files efficiently.
     """
 
-    def __init__(self) -> None:
-        self.parser = PythonASTParser()
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        cache_dir: Optional[Path] = None,
+        backend: str = "ast",
+    ) -> None:
+        """
+        Initialize the batch parser.
+
+        Args:
+            max_workers: Maximum number of worker processes (defaults to the
+                number of available CPUs)
+            cache_dir: Directory for the persistent parse cache (disabled
+                when None)
+            backend: Parser backend, "ast" or "tree_sitter"
+        """
+        self.parser = PythonASTParser(cache_dir, backend)
+        self.cache_dir = cache_dir
+        self.backend = backend
+        self.max_workers = max_workers or _available_cpus()
 
     def parse_files(self, file_paths: List[Path]) -> Dict[Path, ModuleInfo]:
         """
         Parse multiple Python files.
 
+        Parsing holds the GIL, so larger batches are split into chunks for
+        a process pool, or parsed in-process without spare CPUs. Either way
+        files are read ahead on threads, so disk waits overlap parsing.
+        Small batches are parsed in-process to avoid the startup cost.
+
         Args:
             file_paths: List of Python files to parse
 
         Returns:
             Dictionary mapping file paths to ModuleInfo objects
         """
-        results = {}
-
-        for file_path in file_paths:
+        workers = min(self.max_workers, len(file_paths))
+
+        if len(file_paths) >= PARALLEL_PARSE_THRESHOLD and workers > 1:
+            chunksize = max(1, len(file_paths) // (4 * workers))
+            chunks = [
+                file_paths[i : i + chunksize]
+                for i in range(0, len(file_paths), chunksize)
+            ]
             try:
-                module_info = self.parser.parse_file(file_path)
-                results[file_path] = module_info
-            except Exception as e:
-                # Create a ModuleInfo with error information
-                error_info = ModuleInfo(
-                    file_path=file_path, syntax_errors=[f"Failed to parse: {str(e)}"]
-                )
-                results[file_path] = error_info
-
-        return results
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_worker,
+                    initargs=(self.cache_dir, self.backend),
+                ) as executor:
+                    parsed = executor.map(_parse_chunk_in_worker, chunks)
+                    return dict(zip(file_paths, chain.from_iterable(parsed)))
+            except (OSError, NotImplementedError, BrokenProcessPool):
+                # Process pools are unavailable in some sandboxes and
+                # restricted platforms; parse in-process instead
+                pass
+
+        if len(file_paths) >= PARALLEL_PARSE_THRESHOLD:
+            parsed_files = _parse_files_read_ahead(self.parser, file_paths)
+            return dict(zip(file_paths, parsed_files))
+
+        return {
+            file_path: _parse_file_safely(self.parser, file_path)
+            for file_path in file_paths
+        }
 
     def get_import_graph(self, modules: Dict[Path, ModuleInfo]) -> Dict[str, Set[str]]:
         """
@@ -364,16 +780,10 @@ class BatchParser:
         Returns:
             Dictionary mapping module names to sets of imported modules
         """
-        import_graph = {}
+        import_graph: Dict[str, Set[str]] = {}
 
         for file_path, module_info in modules.items():
-            module_name = self._path_to_module_name(file_path)
-            imported_modules = set()
-
-            for import_info in module_info.imports:
-                imported_modules.add(import_info.module)
-
-            import_graph[module_name] = imported_modules
+            self._add_imports(import_graph, file_path, module_info)
 
         return import_graph
 
@@ -389,22 +799,64 @@ class BatchParser:
         Returns:
             Dictionary mapping class names to sets of base classes
         """
-        inheritance_graph = {}
+        inheritance_graph: Dict[str, Set[str]] = {}
 
         for module_info in modules.values():
-            for class_info in module_info.classes:
-                class_name = class_info.name
-                base_classes = set(class_info.bases)
-                inheritance_graph[class_name] = base_classes
-
-                # Include nested classes
-                for nested_class in class_info.nested_classes:
-                    nested_name = f"{class_name}.{nested_class.name}"
-                    nested_bases = set(nested_class.bases)
-                    inheritance_graph[nested_name] = nested_bases
+            self._add_inheritance(inheritance_graph, module_info)
 
         return inheritance_graph
 
+    def get_graphs(
+        self, modules: Dict[Path, ModuleInfo]
+    ) -> Tuple[Dict[str, Set[str]], Dict[str, Set[str]]]:
+        """
+        Build the import and inheritance graphs in a single pass.
+
+        Args:
+            modules: Dictionary of parsed modules
+
+        Returns:
+            Tuple of (import graph, inheritance graph), as returned by
+            get_import_graph and get_inheritance_graph
+        """
+        import_graph: Dict[str, Set[str]] = {}
+        inheritance_graph: Dict[str, Set[str]] = {}
+
+        for file_path, module_info in modules.items():
+            self._add_imports(import_graph, file_path, module_info)
+            self._add_inheritance(inheritance_graph, module_info)
+
+        return import_graph, inheritance_graph
+
+    def _add_imports(
+        self,
+        import_graph: Dict[str, Set[str]],
+        file_path: Path,
+        module_info: ModuleInfo,
+    ) -> None:
+        """Add a module's imports to an import graph."""
+        module_name = self._path_to_module_name(file_path)
+        # Names unpickled from pool workers are copies; share one per name
+        import_graph[module_name] = {
+            sys.intern(import_info.module) for import_info in module_info.imports
+        }
+
+    @staticmethod
+    def _add_inheritance(
+        inheritance_graph: Dict[str, Set[str]], module_info: ModuleInfo
+    ) -> None:
+        """Add a module's classes to an inheritance graph."""
+        for class_info in module_info.classes:
+            class_name = class_info.name
+            inheritance_graph[class_name] = set(map(sys.intern, class_info.bases))
+
+            # Include nested classes
+            for nested_class in class_info.nested_classes:
+                nested_name = f"{class_name}.{nested_class.name}"
+                inheritance_graph[nested_name] = set(
+                    map(sys.intern, nested_class.bases)
+                )
+
     @staticmethod
     def _path_to_module_name(file_path: Path) -> str:
         """Convert a file path to a module name."""
@@ -2,6 +2,7 @@
 Directory and file scanning functionality for Python codebases.
 """
 
+import os
 import re
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
@@ -22,6 +23,28 @@ class ScanResult:
     errors: List[Tuple[Path, str]]  # (file_path, error_message)
 
 
+def _count_lines(file_path: Path) -> int:
+    """
+    Count the lines of a file as iterating over it in text mode would.
+
+    Counting newline bytes avoids decoding the file and building a string
+    per line. Text mode also ends lines at carriage returns, and counts a
+    final unterminated line unless it is only undecodable bytes.
+    """
+    with open(file_path, "rb") as f:
+        data = f.read()
+
+    lines = data.count(b"\n")
+    if b"\r" in data:
+        lines += data.count(b"\r") - data.count(b"\r\n")
+
+    last_line = data[max(data.rfind(b"\n"), data.rfind(b"\r")) + 1 :]
+    if last_line and last_line.decode("utf-8", errors="ignore"):
+        lines += 1
+
+    return lines
+
+
 class DirectoryScanner:
     """
     Efficiently scans directories for Python files and packages.
@@ -84,15 +107,74 @@ class DirectoryScanner:
     def _find_python_files(
         self, root_path: Path, recursive: bool
     ) -> Generator[Path, None, None]:
-        """Find all Python files in the directory."""
-        if recursive:
-            pattern = "**/*.py"
-        else:
-            pattern = "*.py"
+        """
+        Find all Python files in the directory.
+
+        Directories are listed on a thread pool, since os.scandir releases
+        the GIL while it waits on the file system. Every subdirectory is
+        queued as soon as its parent is listed, while results are consumed
+        depth-first. Files are yielded in pre-order: each directory's files,
+        then its subdirectories in listing order.
+        """
+        if not recursive:
+            files, _ = self._list_directory(root_path, recursive)
+            yield from files
+            return
 
-        for file_path in root_path.glob(pattern):
-            if self.path_filter.should_include(file_path):
-                yield file_path
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = [executor.submit(self._list_directory, root_path, recursive)]
+
+            while pending:
+                files, subdirectories = pending.pop().result()
+                yield from files
+
+                # Depth-first, visiting subdirectories in listing order
+                pending.extend(
+                    executor.submit(self._list_directory, directory, recursive)
+                    for directory in reversed(subdirectories)
+                )
+
+    def _list_directory(
+        self, directory: Path, recursive: bool
+    ) -> Tuple[List[Path], List[Path]]:
+        """
+        List the Python files and subdirectories to scan in one directory.
+
+        os.scandir entries carry the file type from the directory listing,
+        so most entries need no stat call. Directories whose name is
+        excluded are not descended into; every file below them would be
+        rejected by should_include anyway.
+
+        Returns:
+            Tuple of (included Python files, subdirectories to descend into)
+        """
+        files: List[Path] = []
+        subdirectories: List[Path] = []
+
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    try:
+                        if name.endswith(".py") and entry.is_file():
+                            file_path = Path(entry.path)
+                            if self.path_filter.should_include(file_path):
+                                files.append(file_path)
+                        elif (
+                            recursive
+                            and entry.is_dir(follow_symlinks=False)
+                            and not self.path_filter.should_exclude_directory(
+                                Path(name)
+                            )
+                        ):
+                            subdirectories.append(Path(entry.path))
+                    except OSError:
+                        continue
+        except OSError:
+            # Unreadable directories are skipped, as glob does
+            pass
+
+        return files, subdirectories
 
     def _analyze_packages(
         self, python_files: List[Path], root_path: Path
@@ -149,8 +231,7 @@ class DirectoryScanner:
         if len(python_files) < 50:
             for file_path in python_files:
                 try:
-                    with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                        total_lines += sum(1 for _ in f)
+                    total_lines += _count_lines(file_path)
                 except Exception as e:
                     errors.append((file_path, str(e)))
             return total_lines, errors
@@ -176,8 +257,7 @@ class DirectoryScanner:
     def _count_file_lines(file_path: Path) -> int:
         """Count lines in a single file."""
         try:
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                return sum(1 for _ in f)
+            return _count_lines(file_path)
         except Exception:
             return 0
 
@@ -0,0 +1,552 @@
+"""
+Optional tree-sitter backend for extracting structure from Python sources.
+
+Requires the ``tree-sitter`` (0.25+) and ``tree-sitter-python`` packages,
+installed by the ``tree-sitter`` extra. Select it with
+``PythonASTParser(backend="tree_sitter")``.
+"""
+
+import ast
+import inspect
+import sys
+import unicodedata
+from bisect import bisect_left
+from typing import List, Optional, cast
+
+from .parser import (
+    ClassInfo,
+    FunctionInfo,
+    ImportInfo,
+    ModuleInfo,
+    _StructureExtractor,
+)
+
+try:
+    import tree_sitter
+    import tree_sitter_python
+
+    # QueryCursor was added in tree-sitter 0.25
+    HAS_TREE_SITTER = hasattr(tree_sitter, "QueryCursor")
+except ImportError:
+    HAS_TREE_SITTER = False
+
+
+# Statement nodes whose children may hold further statements
+_CONTAINER_TYPES = frozenset(
+    {
+        "module",
+        "block",
+        "decorated_definition",
+        "if_statement",
+        "elif_clause",
+        "else_clause",
+        "for_statement",
+        "while_statement",
+        "try_statement",
+        "except_clause",
+        "except_group_clause",
+        "finally_clause",
+        "with_statement",
+        "match_statement",
+        "case_clause",
+    }
+)
+
+_STRING_TYPES = frozenset({"string", "concatenated_string"})
+
+# Calls, plus statements the grammar accepts but Python 3 does not (or that
+# it misreads), which need a closer look
+_CALLS_QUERY = """
+(call) @call
+(type_alias_statement) @type_alias
+(print_statement) @python2
+(exec_statement) @python2
+"""
+
+# Wrappers ast has no node for. The grammar also misreads '*a.b()' as
+# '(*a).b()', so splats are unwrapped when naming calls.
+_TRANSPARENT_TYPES = frozenset(
+    {"parenthesized_expression", "list_splat", "dictionary_splat"}
+)
+
+# Base class list entries that are not base classes
+_NON_BASE_TYPES = frozenset(
+    {"keyword_argument", "list_splat", "dictionary_splat", "comment"}
+)
+
+
+class TreeSitterParser:
+    """
+    Extracts module structure from a tree-sitter syntax tree.
+
+    Produces the same information as PythonASTParser's ast walk, including
+    which statements count as functions, methods and globals. Decorators
+    that are not names, attributes or calls are reported as source text.
+    """
+
+    def __init__(self) -> None:
+        if not HAS_TREE_SITTER:
+            raise ImportError(
+                "The tree-sitter backend requires the tree-sitter (0.25+) and "
+                "tree-sitter-python packages. "
+                "Install with: pip install 'idgi[tree-sitter]'"
+            )
+
+        language = tree_sitter.Language(tree_sitter_python.language())
+        self._parser = tree_sitter.Parser(language)
+        # Matched in C, which is far cheaper than visiting every node here
+        self._query = tree_sitter.Query(language, _CALLS_QUERY)
+
+    def extract(self, source_bytes: bytes, module_info: ModuleInfo) -> None:
+        """
+        Parse a source and add its structure to module_info.
+
+        Args:
+            source_bytes: Raw contents of the Python file
+            module_info: ModuleInfo to fill in
+        """
+        root = self._parser.parse(source_bytes).root_node
+        _TreeSitterExtractor(self._query).extract(root, module_info)
+
+
+class _TreeSitterExtractor(_StructureExtractor):
+    """Extracts module structure from one file's syntax tree."""
+
+    def __init__(self, query: "tree_sitter.Query") -> None:
+        super().__init__()
+        self._query = query
+
+        # Calls in the file as parallel lists sorted by position
+        self._call_offsets: List[int] = []
+        self._call_names: List[str] = []
+
+    def extract(self, root: "tree_sitter.Node", module_info: ModuleInfo) -> None:
+        """
+        Add the structure of a parsed module to module_info.
+
+        Args:
+            root: Root node of the syntax tree
+            module_info: ModuleInfo to fill in
+        """
+        error_line = self._find_error_line(root) if root.has_error else None
+        if error_line is None:
+            error_line = self._collect_calls(root)
+
+        if error_line is not None:
+            module_info.syntax_errors.append(
+                f"Syntax error: invalid syntax "
+                f"({module_info.file_path}, line {error_line})"
+            )
+            return
+
+        module_info.docstring = self._get_docstring(root)
+        self._visit_node(root, module_info)
+
+    def _visit_node(self, node: "tree_sitter.Node", module_info: ModuleInfo) -> None:
+        """Visit a syntax node and extract relevant information."""
+        stack = [node]
+
+        while stack:
+            node = stack.pop()
+            node_type = node.type
+
+            if node_type == "function_definition":
+                self._visit_function(node, module_info)
+                body = node.child_by_field_name("body")
+                if body is not None:
+                    stack.append(body)
+                continue
+
+            if node_type == "class_definition":
+                self._visit_class(node, module_info)
+                continue
+
+            if node_type == "import_statement":
+                self._process_import(node, module_info)
+            elif node_type in ("import_from_statement", "future_import_statement"):
+                self._process_import_from(node, module_info)
+            elif node_type == "expression_statement":
+                self._process_assignment(node, module_info)
+            elif node_type in _CONTAINER_TYPES:
+                # Push children in reverse so they are visited in source order
+                stack.extend(reversed(node.named_children))
+
+    def _process_import(
+        self, node: "tree_sitter.Node", module_info: ModuleInfo
+    ) -> None:
+        """Process an import statement."""
+        for name_node in node.children_by_field_name("name"):
+            if name_node.type == "aliased_import":
+                module = self._dotted_name(name_node.child_by_field_name("name"))
+                alias = name_node.child_by_field_name("alias")
+            else:
+                module = self._dotted_name(name_node)
+                alias = None
+
+            import_info = ImportInfo(
+                module=module,
+                names=[module],
+                line_number=node.start_point[0] + 1,
+                is_from_import=False,
+            )
+
+            if alias is not None:
+                import_info.aliases[module] = self._identifier(alias)
+
+            module_info.imports.append(import_info)
+
+    def _process_import_from(
+        self, node: "tree_sitter.Node", module_info: ModuleInfo
+    ) -> None:
+        """Process a 'from ... import ...' statement."""
+        if node.type == "future_import_statement":
+            module = "__future__"
+        else:
+            module_node = node.child_by_field_name("module_name")
+            if module_node is not None and module_node.type == "relative_import":
+                # The module name follows the dots; 'from . import x' has none
+                module_node = next(
+                    (c for c in module_node.named_children if c.type == "dotted_name"),
+                    None,
+                )
+            if module_node is None:
+                return
+            module = self._dotted_name(module_node)
+
+        names = []
+        aliases = {}
+
+        for name_node in node.children_by_field_name("name"):
+            if name_node.type == "aliased_import":
+                name = self._dotted_name(name_node.child_by_field_name("name"))
+                alias = name_node.child_by_field_name("alias")
+                if alias is not None:
+                    aliases[name] = self._identifier(alias)
+            else:
+                name = self._dotted_name(name_node)
+            names.append(name)
+
+        if any(child.type == "wildcard_import" for child in node.named_children):
+            names.append("*")
+
+        import_info = ImportInfo(
+            module=module,
+            names=names,
+            aliases=aliases,
+            line_number=node.start_point[0] + 1,
+            is_from_import=True,
+        )
+
+        module_info.imports.append(import_info)
+
+    def _process_function(
+        self, node: "tree_sitter.Node", module_info: ModuleInfo
+    ) -> FunctionInfo:
+        """Process a function definition."""
+        func_info = FunctionInfo(
+            name=self._identifier(node.child_by_field_name("name")),
+            line_start=node.start_point[0] + 1,
+            line_end=self._end_line(node),
+            is_async=node.children[0].type == "async",
+        )
+
+        # Extract function arguments
+        parameters = node.child_by_field_name("parameters")
+        if parameters is not None:
+            func_info.args = self._get_args(parameters)
+
+        # Extract decorators
+        func_info.decorators = [
+            self._get_decorator_name(dec) for dec in self._get_decorators(node)
+        ]
+
+        # Extract docstring
+        func_info.docstring = self._get_docstring(node.child_by_field_name("body"))
+
+        # Calls anywhere in the definition, decorators included
+        outer = node.parent if self._is_decorated(node) else node
+        func_info.calls = self._calls_within(outer or node)
+
+        return func_info
+
+    def _process_class(
+        self, node: "tree_sitter.Node", module_info: ModuleInfo
+    ) -> ClassInfo:
+        """Process a class definition."""
+        name = self._identifier(node.child_by_field_name("name"))
+        class_info = ClassInfo(
+            name=name,
+            line_start=node.start_point[0] + 1,
+            line_end=self._end_line(node),
+        )
+
+        # Extract base classes
+        superclasses = node.child_by_field_name("superclasses")
+        if superclasses is not None:
+            for base in superclasses.named_children:
+                if base.type in _NON_BASE_TYPES:
+                    continue
+                base_name = self._get_name(base)
+                if base_name:
+                    class_info.bases.append(base_name)
+
+        # Extract decorators
+        class_info.decorators = [
+            self._get_decorator_name(dec) for dec in self._get_decorators(node)
+        ]
+
+        # Extract docstring
+        body = node.child_by_field_name("body")
+        class_info.docstring = self._get_docstring(body)
+
+        # Process methods and nested classes
+        self.current_class_stack.append(name)
+
+        for child in body.named_children if body is not None else []:
+            definition = child
+            if child.type == "decorated_definition":
+                definition = child.child_by_field_name("definition") or child
+
+            if definition.type == "function_definition":
+                method_info = self._process_function(definition, module_info)
+                method_info.is_method = True
+                method_info.parent_class = name
+                class_info.methods.append(method_info)
+
+            elif definition.type == "class_definition":
+                nested_class = self._process_class(definition, module_info)
+                class_info.nested_classes.append(nested_class)
+            else:
+                self._visit_node(child, module_info)
+
+        self.current_class_stack.pop()
+
+        return class_info
+
+    def _process_assignment(
+        self, node: "tree_sitter.Node", module_info: ModuleInfo
+    ) -> None:
+        """Process variable assignments at module level."""
+        if self.current_class_stack:  # Only global variables
+            return
+
+        for child in node.named_children:
+            # Annotated assignments are not plain assignments in ast either
+            if child.type != "assignment" or child.child_by_field_name("type"):
+                continue
+
+            # 'a = b = 1' nests the second assignment on the right
+            target: Optional["tree_sitter.Node"] = child
+            while target is not None and target.type == "assignment":
+                left = target.child_by_field_name("left")
+                if left is not None and left.type == "identifier":
+                    module_info.global_variables.append(self._identifier(left))
+                target = target.child_by_field_name("right")
+
+    def _get_args(self, parameters: "tree_sitter.Node") -> List[str]:
+        """Extract positional-or-keyword argument names, as ast's args.args."""
+        args: List[str] = []
+
+        for param in parameters.named_children:
+            param_type = param.type
+            if param_type == "identifier":
+                args.append(self._identifier(param))
+            elif param_type in ("default_parameter", "typed_default_parameter"):
+                args.append(self._identifier(param.child_by_field_name("name")))
+            elif param_type == "typed_parameter":
+                inner = param.named_children[0]
+                if inner.type != "identifier":
+                    # Annotated *args or **kwargs
+                    break
+                args.append(self._identifier(inner))
+            elif param_type == "positional_separator":
+                # Everything so far was positional-only
+                args.clear()
+            elif param_type not in ("comment", "line_continuation"):
+                # '*', '*args' or '**kwargs'; keyword-only arguments follow
+                break
+
+        return args
+
+    def _get_decorators(self, node: "tree_sitter.Node") -> List["tree_sitter.Node"]:
+        """Get the decorator nodes applied to a definition."""
+        if not self._is_decorated(node):
+            return []
+        parent = node.parent
+        if parent is None:
+            return []
+        return [child for child in parent.named_children if child.type == "decorator"]
+
+    @staticmethod
+    def _is_decorated(node: "tree_sitter.Node") -> bool:
+        """Check whether a definition is wrapped in decorators."""
+        parent = node.parent
+        return parent is not None and parent.type == "decorated_definition"
+
+    def _get_decorator_name(self, decorator: "tree_sitter.Node") -> str:
+        """Extract decorator name from a decorator node."""
+        expression = next(
+            (c for c in decorator.named_children if c.type != "comment"), decorator
+        )
+
+        if expression.type == "identifier":
+            return self._identifier(expression)
+        elif expression.type == "attribute":
+            name = self._get_name(expression)
+        elif expression.type == "call":
+            name = self._get_name(expression.child_by_field_name("function"))
+        else:
+            name = None
+
+        return name if name is not None else self._text(expression)
+
+    def _get_name(self, node: Optional["tree_sitter.Node"]) -> Optional[str]:
+        """Extract name from various syntax node types."""
+        while node is not None and node.type in _TRANSPARENT_TYPES:
+            node = next((c for c in node.named_children if c.type != "comment"), None)
+
+        if node is None:
+            return None
+
+        node_type = node.type
+        if node_type == "identifier":
+            return self._identifier(node)
+        elif node_type == "attribute":
+            value = self._get_name(node.child_by_field_name("object"))
+            attr = self._identifier(node.child_by_field_name("attribute"))
+            if value:
+                return sys.intern(f"{value}.{attr}")
+            return attr
+        elif node_type in _STRING_TYPES:
+            return self._literal_string(node)
+        else:
+            return None
+
+    def _get_docstring(self, body: Optional["tree_sitter.Node"]) -> Optional[str]:
+        """Extract the docstring from a module or block, as ast.get_docstring."""
+        if body is None:
+            return None
+
+        first = next((c for c in body.named_children if c.type != "comment"), None)
+        if first is None or first.type != "expression_statement":
+            return None
+
+        expressions = first.named_children
+        if len(expressions) != 1 or expressions[0].type not in _STRING_TYPES:
+            return None
+
+        docstring = self._literal_string(expressions[0])
+        return inspect.cleandoc(docstring) if docstring is not None else None
+
+    def _literal_string(self, node: "tree_sitter.Node") -> Optional[str]:
+        """Evaluate a string literal, or None for f-strings and bytes."""
+        if node.type == "concatenated_string":
+            # Parts may sit on separate lines, so evaluate them one by one
+            parts = [
+                self._literal_string(part)
+                for part in node.named_children
+                if part.type == "string"
+            ]
+            if any(part is None for part in parts):
+                return None
+            return "".join(cast(List[str], parts))
+
+        try:
+            value = ast.literal_eval(self._text(node))
+        except Exception:
+            return None
+        return value if isinstance(value, str) else None
+
+    def _collect_calls(self, root: "tree_sitter.Node") -> Optional[int]:
+        """
+        Record every named call in the file, in source order.
+
+        Returns:
+            Line of the first Python 2 statement, if any
+        """
+        captures = tree_sitter.QueryCursor(self._query).captures(root)
+
+        python2_lines = [
+            node.start_point[0] + 1
+            for node in captures.get("python2", [])
+            # 'print >> stream' is still a valid expression
+            if not any(child.type == "chevron" for child in node.named_children)
+        ]
+        if python2_lines:
+            return min(python2_lines)
+
+        calls = []
+        for node in captures.get("call", []):
+            call_name = self._get_name(node.child_by_field_name("function"))
+            if call_name:
+                calls.append((node.start_byte, call_name))
+
+        for node in captures.get("type_alias", []):
+            # The grammar reads 'type(x).attr = value' as a type alias
+            left = node.child_by_field_name("left")
+            alias = left.named_children[0] if left is not None else None
+            if alias is not None and alias.type not in ("identifier", "generic_type"):
+                calls.append((node.start_byte, "type"))
+
+        calls.sort()
+        self._call_offsets = [offset for offset, _ in calls]
+        self._call_names = [name for _, name in calls]
+        return None
+
+    def _calls_within(self, node: "tree_sitter.Node") -> List[str]:
+        """Get the names of calls made anywhere inside a node."""
+        start = bisect_left(self._call_offsets, node.start_byte)
+        end = bisect_left(self._call_offsets, node.end_byte)
+        return self._call_names[start:end]
+
+    def _dotted_name(self, node: Optional["tree_sitter.Node"]) -> str:
+        """Join a dotted name's parts, ignoring any whitespace between them."""
+        if node is None:
+            return ""
+        if node.type != "dotted_name":
+            return self._identifier(node)
+        return sys.intern(
+            ".".join(
+                self._identifier(part)
+                for part in node.named_children
+                if part.type == "identifier"
+            )
+        )
+
+    @staticmethod
+    def _end_line(node: "tree_sitter.Node") -> int:
+        """Get a node's last line, ignoring trailing comments as ast does."""
+        while True:
+            last = next(
+                (c for c in reversed(node.children) if c.type != "comment"), None
+            )
+            if last is None:
+                return node.end_point[0] + 1
+            node = last
+
+    @staticmethod
+    def _find_error_line(root: "tree_sitter.Node") -> int:
+        """Find the line of the first syntax error in a tree."""
+        node = root
+        while True:
+            if node.type == "ERROR" or node.is_missing:
+                return node.start_point[0] + 1
+            child = next((c for c in node.children if c.has_error), None)
+            if child is None:
+                return node.start_point[0] + 1
+            node = child
+
+    @classmethod
+    def _identifier(cls, node: Optional["tree_sitter.Node"]) -> str:
+        """Get an identifier's name, NFKC-normalized and interned as Python does."""
+        text = cls._text(node)
+        if not text.isascii():
+            text = unicodedata.normalize("NFKC", text)
+        return sys.intern(text)
+
+    @staticmethod
+    def _text(node: Optional["tree_sitter.Node"]) -> str:
+        """Get the source text of a node."""
+        if node is None or node.text is None:
+            return ""
+        return node.text.decode("utf-8", errors="ignore")
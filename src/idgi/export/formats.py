@@ -11,6 +11,9 @@ import networkx as nx
 from ..core.analyzer import AnalysisResult
 from ..graph.visualizer import HAS_GRAPHVIZ, GraphvizRenderer
 
+# Single-pass translation table for characters that must be escaped in DOT strings
+_DOT_ESCAPE_TABLE = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r"})
+
 
 class GraphExporter:
     """
@@ -310,7 +313,7 @@ class GraphExporter:
 
     def _escape_dot_string(self, text: str) -> str:
         """Escape string for DOT format."""
-        return text.replace('"', '\\"').replace("\n", "\\n")
+        return text.translate(_DOT_ESCAPE_TABLE)
 
     def _escape_dot_id(self, node_id: str) -> str:
         """Escape node ID for DOT format."""
@@ -2,9 +2,10 @@
 NetworkX graph construction for different types of code relationships.
 """
 
+import weakref
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, Hashable, List, Optional, Tuple, Union
 
 import networkx as nx
 
@@ -36,6 +37,12 @@ class GraphBuilder:
             analysis_result: Results from CodebaseAnalyzer
         """
         self.analysis_result = analysis_result
+        self._graph_cache: Dict[Tuple[GraphType, bool, Optional[int]], nx.DiGraph] = {}
+        self._graph_cache_source = analysis_result
+        # graph -> (structure fingerprint, metrics) for centrality results
+        self._centrality_cache: weakref.WeakKeyDictionary[
+            nx.DiGraph, Tuple[Hashable, Dict[str, Dict[str, float]]]
+        ] = weakref.WeakKeyDictionary()
 
     def build_graph(
         self,
@@ -54,21 +61,35 @@ class GraphBuilder:
         Returns:
             NetworkX directed graph
         """
+        # Built graphs are only valid for the analysis result they came from
+        if self.analysis_result is not self._graph_cache_source:
+            self._graph_cache.clear()
+            self._graph_cache_source = self.analysis_result
+
+        cache_key = (graph_type, include_external, max_nodes)
+        cached = self._graph_cache.get(cache_key)
+        if cached is not None:
+            # Hand out a copy so callers can't mutate the cached graph
+            return cached.copy()
+
         if graph_type == GraphType.IMPORTS:
-            return self._build_import_graph(include_external, max_nodes)
+            graph = self._build_import_graph(include_external, max_nodes)
         elif graph_type == GraphType.INHERITANCE:
-            return self._build_inheritance_graph(max_nodes)
+            graph = self._build_inheritance_graph(max_nodes)
         elif graph_type == GraphType.CALLS:
-            return self._build_call_graph(max_nodes)
+            graph = self._build_call_graph(max_nodes)
         elif graph_type == GraphType.MODULES:
-            return self._build_module_graph(max_nodes)
+            graph = self._build_module_graph(max_nodes)
         elif graph_type == GraphType.CLASSES:
-            return self._build_class_graph(max_nodes)
+            graph = self._build_class_graph(max_nodes)
         elif graph_type == GraphType.FUNCTIONS:
-            return self._build_function_graph(max_nodes)
+            graph = self._build_function_graph(max_nodes)
         else:
             raise ValueError(f"Unknown graph type: {graph_type}")
 
+        self._graph_cache[cache_key] = graph
+        return graph.copy()
+
     def _build_import_graph(
         self, include_external: bool = False, max_nodes: Optional[int] = None
     ) -> nx.DiGraph:
@@ -395,6 +416,17 @@ class GraphBuilder:
         self, graph: nx.DiGraph
     ) -> Dict[str, Dict[str, float]]:
         """Calculate various centrality metrics for graph nodes."""
+        # Reuse earlier results while the graph's structure is unchanged.
+        # Building the fingerprint is linear, far cheaper than betweenness,
+        # and edge weights are included because pagerank reads them.
+        fingerprint: Hashable = (
+            frozenset(graph.nodes),
+            frozenset(graph.edges(data="weight")),
+        )
+        cached = self._centrality_cache.get(graph)
+        if cached is not None and cached[0] == fingerprint:
+            return {node: dict(values) for node, values in cached[1].items()}
+
         metrics = {}
 
         try:
@@ -434,7 +466,8 @@ class GraphBuilder:
                     "pagerank": 0.0,
                 }
 
-        return metrics
+        self._centrality_cache[graph] = (fingerprint, metrics)
+        return {node: dict(values) for node, values in metrics.items()}
 
     def _get_module_info_by_name(self, module_name: str) -> Optional[ModuleInfo]:
         """Find ModuleInfo by module name."""
@@ -5,7 +5,17 @@ Filtering utilities for path and file selection.
 import fnmatch
 import re
 from pathlib import Path
-from typing import List, Optional, Pattern
+from typing import Dict, FrozenSet, List, Optional, Pattern
+
+# Glob metacharacters; patterns without them only match themselves exactly
+_GLOB_MAGIC = re.compile(r"[*?[]")
+
+# Numbered backreferences and group conditionals, which would refer to the
+# wrong group once a regex is merged into an alternation
+_GROUP_REFERENCE = re.compile(r"\\[0-9]|\(\?\(")
+
+# Entries kept per memo before it is emptied and refilled
+_MEMO_SIZE = 4096
 
 
 class PathFilter:
@@ -81,6 +91,25 @@ class PathFilter:
         self.exclude_regexes = self._compile_patterns(self.exclude_patterns)
         self.include_regexes = self._compile_patterns(self.include_patterns)
 
+        # Merge each list into one alternation so a string is scanned once
+        self._merged_excludes = self._combine_patterns(self.exclude_regexes)
+        self._merged_includes = self._combine_patterns(self.include_regexes)
+
+        # Literal names such as "venv" exclude directories named exactly that
+        self._exclude_names: FrozenSet[str] = frozenset(
+            pattern
+            for pattern in self.exclude_patterns
+            if not (pattern.startswith("/") and pattern.endswith("/"))
+            and not _GLOB_MAGIC.search(pattern)
+        )
+
+        # Path components such as "src" or "tests" and directory names repeat
+        # across nearly every file, so their results are memoized per filter,
+        # keyed by string since hashing a Path is slower. Whole file paths are
+        # unique within a scan and are not memoized.
+        self._excluded_parts: Dict[str, bool] = {}
+        self._excluded_directories: Dict[str, bool] = {}
+
     def _compile_patterns(self, patterns: List[str]) -> List[Pattern[str]]:
         """Compile glob patterns to regex patterns."""
         regex_patterns = []
@@ -103,6 +132,42 @@ class PathFilter:
 
         return regex_patterns
 
+    def _combine_patterns(self, regexes: List[Pattern[str]]) -> List[Pattern[str]]:
+        """
+        Merge compiled patterns into as few regexes as possible.
+
+        Patterns that cannot share an alternation (inline global flags,
+        numbered group references, duplicate group names) stay separate.
+
+        Args:
+            regexes: Compiled patterns
+
+        Returns:
+            Regexes matching a string if and only if one of the patterns does
+        """
+        default_flags = re.compile("", re.IGNORECASE).flags
+        mergeable = []
+        separate = []
+        for regex in regexes:
+            if regex.flags != default_flags or (
+                regex.groups and _GROUP_REFERENCE.search(regex.pattern)
+            ):
+                separate.append(regex)
+            else:
+                mergeable.append(regex)
+
+        if len(mergeable) > 1:
+            try:
+                combined = re.compile(
+                    "|".join(f"(?:{regex.pattern})" for regex in mergeable),
+                    re.IGNORECASE,
+                )
+                mergeable = [combined]
+            except re.error:
+                pass
+
+        return mergeable + separate
+
     def should_include(self, path: Path) -> bool:
         """
         Determine if a path should be included based on filters.
@@ -116,27 +181,41 @@ class PathFilter:
         path_str = str(path)
         path_name = path.name
 
-        # Check if any part of the path matches exclude patterns
-        for exclude_regex in self.exclude_regexes:
-            if exclude_regex.search(path_str) or exclude_regex.search(path_name):
+        # Check if the path, or any part of it, matches exclude patterns
+        for exclude_regex in self._merged_excludes:
+            if exclude_regex.search(path_str):
                 return False
 
-            # Also check individual path parts for directory excludes
-            for part in path.parts:
-                if exclude_regex.search(part):
-                    return False
+        if self._is_excluded_part(path_name):
+            return False
+
+        # Also check individual path parts for directory excludes
+        for part in path.parts:
+            if self._is_excluded_part(part):
+                return False
 
         # If no include patterns specified, include everything not excluded
-        if not self.include_regexes:
+        if not self._merged_includes:
             return True
 
         # Check if path matches any include pattern
-        for include_regex in self.include_regexes:
+        for include_regex in self._merged_includes:
             if include_regex.search(path_str) or include_regex.search(path_name):
                 return True
 
         return False
 
+    def _is_excluded_part(self, part: str) -> bool:
+        """Check whether a single path component matches an exclude pattern."""
+        excluded = self._excluded_parts.get(part)
+        if excluded is None:
+            if len(self._excluded_parts) >= _MEMO_SIZE:
+                self._excluded_parts.clear()
+            excluded = self._excluded_parts[part] = any(
+                exclude_regex.search(part) for exclude_regex in self._merged_excludes
+            )
+        return excluded
+
     def filter_paths(self, paths: List[Path]) -> List[Path]:
         """
         Filter a list of paths.
@@ -160,15 +239,32 @@ class PathFilter:
         Returns:
             True if directory should be excluded from traversal
         """
-        dir_name = directory.name
         dir_path = str(directory)
+        excluded = self._excluded_directories.get(dir_path)
+        if excluded is None:
+            if len(self._excluded_directories) >= _MEMO_SIZE:
+                self._excluded_directories.clear()
+            excluded = self._excluded_directories[dir_path] = (
+                self._should_exclude_directory(directory.name, dir_path)
+            )
+        return excluded
+
+    def _should_exclude_directory(self, dir_name: str, dir_path: str) -> bool:
+        """Unmemoized should_exclude_directory."""
+        if dir_name in self._exclude_names:
+            return True
 
-        for exclude_regex in self.exclude_regexes:
+        for exclude_regex in self._merged_excludes:
             if exclude_regex.search(dir_name) or exclude_regex.search(dir_path):
                 return True
 
         return False
 
+    def cache_clear(self) -> None:
+        """Discard memoized filter results."""
+        self._excluded_parts.clear()
+        self._excluded_directories.clear()
+
 
 class ContentFilter:
     """
@@ -15,12 +15,32 @@ from idgi.graph.builder import GraphBuilder, GraphType
 class TestGraphBuilder(TestCase):
     """Test cases for GraphBuilder."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
+    # Graph type -> (allowed node types, edge relationship, minimum edge count,
+    # node attributes that must be ints)
+    GRAPH_TYPE_EXPECTATIONS = {
+        GraphType.IMPORTS: ({"internal_module", "external_module"}, "imports", 1, ()),
+        GraphType.INHERITANCE: ({"class"}, "inherits_from", 0, ()),
+        GraphType.CALLS: ({"function"}, "calls", 0, ()),
+        GraphType.MODULES: ({"module"}, "depends_on", 0, ("lines_of_code",)),
+        GraphType.CLASSES: ({"class"}, "inherits_from", 0, ("methods",)),
+        GraphType.FUNCTIONS: ({"function", "method"}, "calls", 0, ()),
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test fixtures.
+
+        Tests only read the analysis result and builder, so the codebase is
+        analyzed once for the whole class. Tests must not mutate either; graphs
+        from build_graph are copies and are safe to modify. This keeps tests
+        independent of ordering and of how pytest-xdist splits them.
+        """
+        temp_dir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(temp_dir.cleanup)
+        cls.temp_dir = Path(temp_dir.name)
 
         # Create a simple test codebase
-        (self.temp_dir / "module1.py").write_text("""
+        (cls.temp_dir / "module1.py").write_text("""
 import os
 from module2 import ClassB
 
@@ -32,7 +52,7 @@ def function_a():
     os.path.join("a", "b")
 """)
 
-        (self.temp_dir / "module2.py").write_text("""
+        (cls.temp_dir / "module2.py").write_text("""
 import sys
 
 class ClassB(object):
@@ -45,104 +65,28 @@ def function_b():
 
         # Analyze the codebase
         analyzer = CodebaseAnalyzer()
-        self.analysis_result = analyzer.analyze(self.temp_dir)
-        self.builder = GraphBuilder(self.analysis_result)
+        cls.analysis_result = analyzer.analyze(cls.temp_dir)
+        cls.builder = GraphBuilder(cls.analysis_result)
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
+    def test_build_graph_types(self):
+        """Test building every graph type from the shared analysis."""
+        for graph_type, expectations in self.GRAPH_TYPE_EXPECTATIONS.items():
+            node_types, relationship, min_edges, int_attributes = expectations
 
-        shutil.rmtree(self.temp_dir)
+            with self.subTest(graph_type=graph_type.value):
+                graph = self.builder.build_graph(graph_type)
 
-    def test_build_import_graph(self):
-        """Test building import dependency graph."""
-        graph = self.builder.build_graph(GraphType.IMPORTS)
-
-        self.assertIsInstance(graph, nx.DiGraph)
-        self.assertGreater(len(graph.nodes()), 0)
-
-        # Check that modules are connected by import relationships
-        edges_with_import = [
-            (u, v)
-            for u, v, d in graph.edges(data=True)
-            if d.get("relationship") == "imports"
-        ]
-        self.assertGreater(len(edges_with_import), 0)
-
-    def test_build_inheritance_graph(self):
-        """Test building class inheritance graph."""
-        graph = self.builder.build_graph(GraphType.INHERITANCE)
-
-        self.assertIsInstance(graph, nx.DiGraph)
-
-        # Should have ClassB inheriting from object
-        if len(graph.nodes()) > 0:
-            # Check for inheritance relationships
-            inheritance_edges = [
-                (u, v)
-                for u, v, d in graph.edges(data=True)
-                if d.get("relationship") == "inherits_from"
-            ]
-            self.assertGreaterEqual(
-                len(inheritance_edges), 0
-            )  # May be 0 if no explicit inheritance
-
-    def test_build_call_graph(self):
-        """Test building function call graph."""
-        graph = self.builder.build_graph(GraphType.CALLS)
-
-        self.assertIsInstance(graph, nx.DiGraph)
-
-        # Should have function call relationships
-        if len(graph.nodes()) > 0:
-            call_edges = [
-                (u, v)
-                for u, v, d in graph.edges(data=True)
-                if d.get("relationship") == "calls"
-            ]
-            self.assertGreaterEqual(len(call_edges), 0)
-
-    def test_build_module_graph(self):
-        """Test building module overview graph."""
-        graph = self.builder.build_graph(GraphType.MODULES)
-
-        self.assertIsInstance(graph, nx.DiGraph)
-        self.assertGreater(len(graph.nodes()), 0)
+                self.assertIsInstance(graph, nx.DiGraph)
+                self.assertGreater(len(graph.nodes()), 0)
+                self.assertGreaterEqual(len(graph.edges()), min_edges)
 
-        # Check node attributes
-        for node in graph.nodes():
-            node_data = graph.nodes[node]
-            self.assertEqual(node_data.get("type"), "module")
-            self.assertIsInstance(node_data.get("lines_of_code"), int)
+                for _, node_data in graph.nodes(data=True):
+                    self.assertIn(node_data.get("type"), node_types)
+                    for attribute in int_attributes:
+                        self.assertIsInstance(node_data.get(attribute), int)
 
-    def test_build_class_graph(self):
-        """Test building class-focused graph."""
-        graph = self.builder.build_graph(GraphType.CLASSES)
-
-        self.assertIsInstance(graph, nx.DiGraph)
-
-        # Check that classes have proper attributes
-        class_nodes = [
-            n for n in graph.nodes() if graph.nodes[n].get("type") == "class"
-        ]
-        for node in class_nodes:
-            node_data = graph.nodes[node]
-            self.assertIn("methods", node_data)
-            self.assertIsInstance(node_data["methods"], int)
-
-    def test_build_function_graph(self):
-        """Test building function-focused graph."""
-        graph = self.builder.build_graph(GraphType.FUNCTIONS)
-
-        self.assertIsInstance(graph, nx.DiGraph)
-
-        # Check for function and method nodes
-        function_nodes = [
-            n
-            for n in graph.nodes()
-            if graph.nodes[n].get("type") in ["function", "method"]
-        ]
-        self.assertGreater(len(function_nodes), 0)
+                for _, _, edge_data in graph.edges(data=True):
+                    self.assertEqual(edge_data.get("relationship"), relationship)
 
     def test_max_nodes_limit(self):
         """Test that max_nodes parameter limits graph size."""
@@ -151,6 +95,16 @@ def function_b():
 
         self.assertLessEqual(len(graph.nodes()), 1)
 
+    def test_build_graph_cache_returns_copies(self):
+        """Test that cached graphs are reused without sharing mutable state."""
+        first = self.builder.build_graph(GraphType.MODULES)
+        first.add_node("scratch_node")
+
+        second = self.builder.build_graph(GraphType.MODULES)
+
+        self.assertIsNot(first, second)
+        self.assertNotIn("scratch_node", second.nodes())
+
     def test_get_subgraph(self):
         """Test extraction of subgraphs."""
         graph = self.builder.build_graph(GraphType.MODULES)
@@ -201,6 +155,33 @@ def function_b():
                     self.assertIn(metric, node_metrics)
                     self.assertIsInstance(node_metrics[metric], float)
 
+    def test_centrality_metrics_cache(self):
+        """Test that centrality metrics are reused until the graph changes."""
+        graph = self.builder.build_graph(GraphType.MODULES)
+
+        first = self.builder.calculate_centrality_metrics(graph)
+        first[next(iter(first))]["pagerank"] = -1.0
+        second = self.builder.calculate_centrality_metrics(graph)
+        self.assertNotEqual(second[next(iter(second))]["pagerank"], -1.0)
+
+        graph.add_node("new_node")
+        third = self.builder.calculate_centrality_metrics(graph)
+        self.assertIn("new_node", third)
+
+    def test_centrality_metrics_cache_same_size_change(self):
+        """Test that metrics are recomputed when edges change but not their count."""
+        graph = nx.DiGraph([("a", "b"), ("b", "c")])
+        self.builder.calculate_centrality_metrics(graph)
+
+        graph.remove_edge("a", "b")
+        graph.add_edge("c", "a")
+        metrics = self.builder.calculate_centrality_metrics(graph)
+
+        fresh_builder = GraphBuilder(self.analysis_result)
+        self.assertEqual(
+            metrics, fresh_builder.calculate_centrality_metrics(graph.copy())
+        )
+
     def test_include_external_dependencies(self):
         """Test inclusion of external dependencies in import graph."""
         graph = self.builder.build_graph(GraphType.IMPORTS, include_external=True)
@@ -216,10 +197,9 @@ def function_b():
     def test_empty_analysis_result(self):
         """Test handling of empty analysis results."""
         # Create empty temp directory
-        empty_dir = Path(tempfile.mkdtemp())
-        try:
+        with tempfile.TemporaryDirectory() as empty_dir:
             analyzer = CodebaseAnalyzer()
-            empty_result = analyzer.analyze(empty_dir)
+            empty_result = analyzer.analyze(Path(empty_dir))
             empty_builder = GraphBuilder(empty_result)
 
             graph = empty_builder.build_graph(GraphType.MODULES)
@@ -227,8 +207,3 @@ def function_b():
             # Should handle empty results gracefully
             self.assertIsInstance(graph, nx.DiGraph)
             self.assertEqual(len(graph.nodes()), 0)
-
-        finally:
-            import shutil
-
-            shutil.rmtree(empty_dir)
@@ -2,11 +2,19 @@
 Tests for the Python AST parser module.
 """
 
+import shutil
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from unittest import TestCase
+from unittest import TestCase, mock, skipUnless
 
-from idgi.core.parser import BatchParser, PythonASTParser
+from idgi.core.parser import (
+    PARALLEL_PARSE_THRESHOLD,
+    BatchParser,
+    PythonASTParser,
+    _parse_files_read_ahead,
+)
+from idgi.core.tree_sitter_parser import HAS_TREE_SITTER
 
 
 class TestPythonASTParser(TestCase):
@@ -19,8 +27,6 @@ class TestPythonASTParser(TestCase):
 
     def tearDown(self):
         """Clean up test fixtures."""
-        import shutil
-
         shutil.rmtree(self.temp_dir)
 
     def _create_test_file(self, content: str) -> Path:
@@ -191,6 +197,99 @@ def my_function():
         self.assertIn("some_function", calls)
         self.assertIn("len", calls)
 
+    def test_nested_function_calls(self):
+        """Test that calls in nested functions are attributed to both."""
+        content = """
+@register(make_key())
+def outer(arg=default()):
+    first()
+    def inner():
+        second(third())
+    return inner
+
+class Outer:
+    def method(self):
+        def helper():
+            fourth()
+        helper()
+"""
+
+        test_file = self._create_test_file(content)
+        module_info = self.parser.parse_file(test_file)
+
+        functions = {f.name: f for f in module_info.functions}
+        self.assertEqual(
+            functions["outer"].calls,
+            ["register", "default", "first", "make_key", "second", "third"],
+        )
+        self.assertEqual(functions["inner"].calls, ["second", "third"])
+
+        method = module_info.classes[0].methods[0]
+        self.assertEqual(method.calls, ["helper", "fourth"])
+
+    def test_source_encodings(self):
+        """Test coding cookies, BOMs and undecodable bytes."""
+        test_file = self.temp_dir / "test.py"
+        for source, docstring in [
+            ('# coding: latin-1\n"""Caf\xe9."""\n'.encode("latin-1"), "Café."),
+            (b'\xef\xbb\xbf"""Bom."""\n', "Bom."),
+            (b'"""Bad \xff byte."""\n', "Bad  byte."),
+        ]:
+            with self.subTest(source=source):
+                test_file.write_bytes(source)
+                module_info = self.parser.parse_file(test_file)
+
+                self.assertEqual(module_info.syntax_errors, [])
+                self.assertEqual(module_info.docstring, docstring)
+
+    def test_comment_only_file(self):
+        """Test that files without code are not handed to the parser."""
+        test_file = self._create_test_file("# Package 1\n\n    # indented\n")
+
+        with mock.patch("idgi.core.parser.ast.parse", side_effect=AssertionError):
+            module_info = self.parser.parse_file(test_file)
+
+        self.assertEqual(module_info.syntax_errors, [])
+        self.assertEqual(module_info.line_count, 4)
+        self.assertEqual(module_info.imports, [])
+
+        # Lone carriage returns end lines too, as in text mode
+        test_file.write_bytes(b"# one\r# two\r\n# three\r")
+        module_info = self.parser.parse_file(test_file)
+        self.assertEqual(module_info.line_count, 4)
+
+    def test_parse_cache(self):
+        """Test that unchanged sources are served from the parse cache."""
+        cache_dir = self.temp_dir / "cache"
+        content = "import os\n\ndef cached_function():\n    os.getcwd()\n"
+        first_file = self.temp_dir / "first.py"
+        first_file.write_text(content)
+        second_file = self.temp_dir / "second.py"
+        second_file.write_text(content)
+
+        first = PythonASTParser(cache_dir=cache_dir).parse_file(first_file)
+        self.assertEqual(len(list(cache_dir.glob("*/*.pkl"))), 1)
+
+        # A hit must not reach ast.parse and must report the requested path
+        with mock.patch("idgi.core.parser.ast.parse", side_effect=AssertionError):
+            second = PythonASTParser(cache_dir=cache_dir).parse_file(second_file)
+
+        self.assertEqual(second.file_path, second_file)
+        self.assertEqual(second.syntax_errors, [])
+        self.assertEqual(second.functions, first.functions)
+        self.assertEqual(second.imports, first.imports)
+
+    def test_unknown_backend(self):
+        """Test that unknown parser backends are rejected."""
+        with self.assertRaises(ValueError):
+            PythonASTParser(backend="unknown")
+
+    def test_tree_sitter_backend_unavailable(self):
+        """Test that a missing or outdated tree-sitter is reported."""
+        with mock.patch("idgi.core.tree_sitter_parser.HAS_TREE_SITTER", False):
+            with self.assertRaises(ImportError):
+                PythonASTParser(backend="tree_sitter")
+
     def test_syntax_error_handling(self):
         """Test handling of syntax errors."""
         content = """
@@ -208,6 +307,85 @@ def broken_function(
         )  # Should not parse functions due to error
 
 
+def _sort_calls(module_info):
+    """Sort recorded calls, whose order differs between parser backends."""
+    classes = list(module_info.classes)
+    functions = list(module_info.functions)
+    while classes:
+        class_info = classes.pop()
+        classes.extend(class_info.nested_classes)
+        functions.extend(class_info.methods)
+
+    for func_info in functions:
+        func_info.calls.sort()
+    return module_info
+
+
+@skipUnless(HAS_TREE_SITTER, "tree-sitter 0.25+ is not installed")
+class TestTreeSitterParser(TestCase):
+    """Test cases for the tree-sitter parser backend."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.parser = PythonASTParser(backend="tree_sitter")
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_matches_ast_backend(self):
+        """Test that both backends extract the same information."""
+        test_file = self.temp_dir / "test.py"
+        test_file.write_text('''"""Module docstring."""
+import os
+import sys as system
+from .relative import helper
+from typing import (
+    Dict,  # comment
+    List as L,
+)
+
+CONSTANT = other = 42
+annotated: int = 1
+
+@decorator.attr(option=True)
+async def async_function(pos, /, arg1, arg2="default", *args, kw, **kwargs):
+    """An async function."""
+    await some_coroutine(os.path.join("a", "b"))
+    return "{}".format(len(args))
+
+class DerivedClass(BaseClass, metaclass=Meta):
+    """Derived class."""
+
+    class_var = "not global"
+
+    def method(self):
+        def inner():
+            return helper()
+        return inner()  # trailing comment
+
+    class NestedClass(object):
+        pass
+''')
+
+        ast_info = _sort_calls(PythonASTParser().parse_file(test_file))
+        tree_sitter_info = _sort_calls(self.parser.parse_file(test_file))
+
+        self.assertEqual(tree_sitter_info.syntax_errors, [])
+        self.assertEqual(tree_sitter_info, ast_info)
+
+    def test_syntax_error_handling(self):
+        """Test handling of syntax errors."""
+        test_file = self.temp_dir / "test.py"
+        test_file.write_text("def broken_function(\n    pass\n")
+
+        module_info = self.parser.parse_file(test_file)
+
+        self.assertGreater(len(module_info.syntax_errors), 0)
+        self.assertEqual(len(module_info.functions), 0)
+
+
 class TestBatchParser(TestCase):
     """Test cases for BatchParser."""
 
@@ -218,8 +396,6 @@ class TestBatchParser(TestCase):
 
     def tearDown(self):
         """Clean up test fixtures."""
-        import shutil
-
         shutil.rmtree(self.temp_dir)
 
     def test_parse_multiple_files(self):
@@ -241,6 +417,49 @@ class TestBatchParser(TestCase):
         self.assertEqual(len(results[file1].functions), 1)
         self.assertEqual(len(results[file2].classes), 1)
 
+    def test_parse_files_in_process_pool(self):
+        """Test that pooled parsing matches in-process parsing."""
+        file_paths = []
+        for i in range(PARALLEL_PARSE_THRESHOLD + 2):
+            file_path = self.temp_dir / f"module{i}.py"
+            file_path.write_text(f"import os\n\nclass Class{i}:\n    pass\n")
+            file_paths.append(file_path)
+
+        # parse_files falls back to parsing in-process if the pool fails
+        with mock.patch(
+            "idgi.core.parser.ProcessPoolExecutor", wraps=ProcessPoolExecutor
+        ) as pool:
+            with mock.patch(
+                "idgi.core.parser._parse_files_read_ahead",
+                wraps=_parse_files_read_ahead,
+            ) as in_process:
+                pooled = BatchParser(max_workers=2).parse_files(file_paths)
+        pool.assert_called_once()
+        in_process.assert_not_called()
+
+        sequential = BatchParser(max_workers=1).parse_files(file_paths)
+
+        self.assertEqual(list(pooled), file_paths)
+        self.assertEqual(pooled, sequential)
+
+    def test_parse_files_with_read_ahead(self):
+        """Test that read-ahead parsing reports unreadable files."""
+        file_paths = []
+        for i in range(PARALLEL_PARSE_THRESHOLD):
+            file_path = self.temp_dir / f"module{i}.py"
+            file_path.write_text(f"def func{i}(): pass\n")
+            file_paths.append(file_path)
+        missing_file = self.temp_dir / "missing.py"
+        file_paths.append(missing_file)
+
+        results = BatchParser(max_workers=1).parse_files(file_paths)
+
+        self.assertEqual(list(results), file_paths)
+        self.assertEqual(len(results[file_paths[0]].functions), 1)
+        self.assertTrue(
+            results[missing_file].syntax_errors[0].startswith("Error reading file")
+        )
+
     def test_import_graph_generation(self):
         """Test generation of import dependency graph."""
         # Create files with imports
@@ -296,3 +515,21 @@ class AnotherDerived(BaseClass, object):
         derived_bases = inheritance_graph["AnotherDerived"]
         self.assertIn("BaseClass", derived_bases)
         self.assertIn("object", derived_bases)
+
+    def test_get_graphs(self):
+        """Test that the single-pass graphs match the separate builders."""
+        file1 = self.temp_dir / "module1.py"
+        file1.write_text(
+            "import os\n\nclass Base:\n    class Inner(dict):\n        pass\n"
+        )
+        file2 = self.temp_dir / "module2.py"
+        file2.write_text("from module1 import Base\n\nclass Derived(Base):\n    pass\n")
+
+        results = self.batch_parser.parse_files([file1, file2])
+        import_graph, inheritance_graph = self.batch_parser.get_graphs(results)
+
+        self.assertEqual(import_graph, self.batch_parser.get_import_graph(results))
+        self.assertEqual(
+            inheritance_graph, self.batch_parser.get_inheritance_graph(results)
+        )
+        self.assertEqual(inheritance_graph["Base.Inner"], {"dict"})
@@ -2,11 +2,12 @@
 Tests for the directory scanner module.
 """
 
+import shutil
 import tempfile
 from pathlib import Path
 from unittest import TestCase
 
-from idgi.core.scanner import DirectoryScanner
+from idgi.core.scanner import DirectoryScanner, _count_lines
 from idgi.utils.filters import PathFilter
 
 
@@ -38,8 +39,6 @@ class TestDirectoryScanner(TestCase):
 
     def tearDown(self):
         """Clean up test fixtures."""
-        import shutil
-
         shutil.rmtree(self.temp_dir)
 
     def test_basic_scan(self):
@@ -61,6 +60,33 @@ class TestDirectoryScanner(TestCase):
         self.assertFalse(any("venv" in path for path in file_paths))
         self.assertFalse(any("__pycache__" in path for path in file_paths))
 
+    def test_scan_matches_glob(self):
+        """Test that scanning finds the same files as globbing."""
+        (self.temp_dir / "package1" / "sub").mkdir()
+        (self.temp_dir / "package1" / "sub" / "deep.py").write_text("x = 1")
+
+        scanner = DirectoryScanner()
+        result = scanner.scan(self.temp_dir)
+
+        # Traversal order differs from glob's on Python 3.12+, so compare sorted
+        expected = sorted(
+            path
+            for path in self.temp_dir.resolve().glob("**/*.py")
+            if scanner.path_filter.should_include(path)
+        )
+        self.assertEqual(sorted(result.python_files), expected)
+
+    def test_line_counting(self):
+        """Test that line counts match iterating over the file as text."""
+        test_file = self.temp_dir / "lines.py"
+        for content in [b"", b"a", b"a\n", b"a\r\nb\rc\n", b"a\n\xff", b"a\r"]:
+            with self.subTest(content=content):
+                test_file.write_bytes(content)
+                with open(test_file, encoding="utf-8", errors="ignore") as f:
+                    expected = sum(1 for _ in f)
+
+                self.assertEqual(_count_lines(test_file), expected)
+
     def test_package_analysis(self):
         """Test package structure analysis."""
         scanner = DirectoryScanner()
@@ -128,3 +154,27 @@ class TestPathFilter(TestCase):
 
         test_dir = Path("test_dir")
         self.assertTrue(path_filter.should_exclude_directory(test_dir))
+
+    def test_regex_patterns(self):
+        """Test regex patterns alongside globs, including unmergeable ones."""
+        path_filter = PathFilter(
+            exclude_patterns=["*.tmp", "/(ab)\\1/", "/(?i)^skip/"],
+            use_default_excludes=False,
+        )
+
+        self.assertFalse(path_filter.should_include(Path("abab.py")))
+        self.assertFalse(path_filter.should_include(Path("skip_me.py")))
+        self.assertFalse(path_filter.should_include(Path("temp.tmp")))
+        self.assertTrue(path_filter.should_include(Path("ab.py")))
+
+    def test_cached_results(self):
+        """Test that memoized results match and can be cleared."""
+        path_filter = PathFilter(exclude_patterns=["test_*"])
+        paths = [Path("pkg/test_module.py"), Path("pkg/module.py")] * 2
+
+        self.assertEqual(path_filter.filter_paths(paths), [Path("pkg/module.py")] * 2)
+        self.assertTrue(path_filter.should_exclude_directory(Path("venv")))
+        self.assertTrue(path_filter.should_exclude_directory(Path("venv")))
+
+        path_filter.cache_clear()
+        self.assertTrue(path_filter.should_include(Path("pkg/module.py")))